@@ -0,0 +1,95 @@
+"""
+Shared pytest fixtures.
+
+Sample CSV inputs are written once per test session. CSV commands write
+their output next to the input file, so tests copy the shared inputs
+into their own tmp_path before running a command on them.
+"""
+
+import csv
+import shutil
+
+import pytest
+
+from tests.fixtures import create_mock_manager
+from tests.fixtures.csv_scenarios import (
+    create_csv_with_embedded_newlines,
+    create_csv_for_field_extraction,
+    create_csv_with_iso_dates
+)
+
+
+# Sample CSV content builders by name
+SAMPLE_CSV_BUILDERS = {
+    "embedded-newlines": create_csv_with_embedded_newlines,
+    "field-extraction": create_csv_for_field_extraction,
+    "iso-dates": create_csv_with_iso_dates,
+}
+
+LARGE_CSV_HEADER = ["Issue key", "Summary", "Parent key", "Status", "Assignee"]
+
+
+@pytest.fixture(scope="session")
+def cached_version():
+    """Resolve the application version once per session."""
+    from version.manager import get_version
+    return get_version()
+
+
+@pytest.fixture(scope="session")
+def cli_parser():
+    """Build the CLI parser once; parse_args does not mutate it."""
+    from cli.parser import build_parser
+    return build_parser()
+
+
+@pytest.fixture
+def copy_csv_to_tmp_path(tmp_path):
+    """Return a function copying a shared CSV file into this test's tmp_path."""
+    def copy_csv(source_csv_file):
+        target_csv_file = tmp_path / source_csv_file.name
+        shutil.copyfile(source_csv_file, target_csv_file)
+        return target_csv_file
+    return copy_csv
+
+
+@pytest.fixture(scope="session")
+def large_csv_files(tmp_path_factory):
+    """
+    Return a function providing a large CSV file with the given row count.
+
+    Each file is streamed to disk once per session with csv.writer, so
+    memory stays flat as the row count grows. Rows contain Issue key,
+    Summary, Parent key, Status and Assignee; parent keys are grouped per
+    10 rows, statuses cycle through 3 values and assignees through 5 users.
+    """
+    directory = tmp_path_factory.mktemp("large-csv")
+    files_by_row_count = {}
+
+    def get_large_csv_file(row_count):
+        if row_count not in files_by_row_count:
+            large_csv_file = directory / f"large-{row_count}.csv"
+            with open(large_csv_file, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(LARGE_CSV_HEADER)
+                writer.writerows((f"PROJ-{i}", f"Task {i}", f"EPIC-{i//10}", f"Status {i%3}", f"User {i%5}") for i in range(row_count))
+            files_by_row_count[row_count] = large_csv_file
+        return files_by_row_count[row_count]
+    return get_large_csv_file
+
+
+@pytest.fixture
+def mock_manager():
+    """Build a fresh pre-wired mock Jira manager for each test."""
+    return create_mock_manager()
+
+
+@pytest.fixture(scope="session")
+def sample_csv_files(tmp_path_factory):
+    """Write each sample CSV once per session and return their paths by name."""
+    directory = tmp_path_factory.mktemp("sample-csv")
+    sample_files = {}
+    for name, create_content in SAMPLE_CSV_BUILDERS.items():
+        sample_files[name] = directory / f"{name}.csv"
+        sample_files[name].write_text(create_content())
+    return sample_files
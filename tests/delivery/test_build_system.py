@@ -6,19 +6,11 @@ Tests the build system from the user's perspective, focusing on end-to-end workf
 
 import tempfile
 import unittest
-from pathlib import Path
 import shutil
-import sys
-
-# Add tools directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools"))
-# Add tests directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from version_manager import VersionManager
 from tests.fixtures import (
     create_test_project_structure, 
-    create_version_file_with_version,
     run_version_command,
     get_version_from_file,
     get_version_components,
@@ -5,45 +5,87 @@ Tests that the release script gives clear errors for unsupported platforms.
 """
 
 import subprocess
-import unittest
 from pathlib import Path
 
+import pytest
 
-class TestReleaseScriptValidation(unittest.TestCase):
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+INVALID_PLATFORMS = ["all", "macos", "linux", "invalid"]
+
+
+@pytest.fixture(scope="class")
+def powershell_session():
+    """
+    Start one PowerShell process shared by the whole test class.
+
+    Release script runs are written to its stdin, so PowerShell starts once
+    instead of once per platform case. Pipes stay binary: the tests only
+    look for ASCII messages, so output is never decoded.
+    """
+    session = subprocess.Popen(
+        ["powershell", "-NoProfile", "-NoLogo", "-NonInteractive", "-Command", "-"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        cwd=PROJECT_ROOT
+    )
+    yield session
+    session.stdin.close()
+    session.wait()
+
+
+def _run_release_script(session, platform):
+    """Run the release script in the shared session and return its exit code and output."""
+    end_marker = f"===END-{platform}==="
+    # Reset $LASTEXITCODE first so an earlier run's exit code cannot be reported for this one
+    command = (
+        f"$LASTEXITCODE = 0; .\\scripts\\release.ps1 -Platform {platform} *>&1; "
+        f"Write-Output \"EXIT:$LASTEXITCODE\"; Write-Output \"{end_marker}\"\n"
+    )
+    session.stdin.write(command.encode())
+    session.stdin.flush()
+
+    output_lines = []
+    ended = False
+    for line in iter(session.stdout.readline, b""):
+        if line.strip() == end_marker.encode():
+            ended = True
+            break
+        output_lines.append(line)
+
+    assert ended and output_lines, \
+        f"PowerShell session ended before reporting the exit code for platform '{platform}'"
+    exit_line = output_lines.pop().strip()
+    assert exit_line.startswith(b"EXIT:"), \
+        f"Expected exit code line before end marker for platform '{platform}', got {exit_line!r}"
+    return int(exit_line.removeprefix(b"EXIT:")), b"".join(output_lines)
+
+
+@pytest.mark.slow
+class TestReleaseScriptValidation:
     """Test cases for release script platform validation."""
-    
-    def test_release_script_rejects_invalid_platforms(self):
+
+    @pytest.mark.parametrize("platform", INVALID_PLATFORMS)
+    def test_release_script_rejects_invalid_platforms(self, powershell_session, platform):
         """Test that release script rejects invalid platforms with clear error messages."""
-        test_cases = [
-            ("all", "[FAIL] Unsupported platform 'all'"),
-            ("macos", "[FAIL] Unsupported platform 'macos'"),
-            ("linux", "[FAIL] Unsupported platform 'linux'"),
-            ("invalid", "[FAIL] Unsupported platform 'invalid'"),
-        ]
-        
-        for platform, expected_error in test_cases:
-            with self.subTest(platform=platform):
-                result = subprocess.run([
-                    "powershell", "-Command", 
-                    f".\\scripts\\release.ps1 -Platform {platform}"
-                ], capture_output=True, text=True, cwd=Path(__file__).parent.parent.parent)
-                
-                # Should fail with exit code 1
-                self.assertEqual(result.returncode, 1, 
-                    f"Expected exit code 1 for platform '{platform}', got {result.returncode}")
-                
-                # Should contain the platform-specific error message
-                self.assertIn(f"Unsupported platform '{platform}'", result.stdout,
-                    f"Expected platform-specific error message not found in output for platform '{platform}'")
-                
-                # Should mention that only Windows is supported
-                self.assertIn("JiraUtil only supports Windows builds", result.stdout,
-                    f"Should mention Windows-only support for platform '{platform}'")
-                
-                # Should show the correct usage
-                self.assertIn("Use: .\\scripts\\release.ps1 -Platform windows", result.stdout,
-                    f"Should show correct usage for platform '{platform}'")
+        # Given/When: The release script is run for an unsupported platform
+        returncode, output = _run_release_script(powershell_session, platform)
+
+        # Then: Should fail with exit code 1
+        assert returncode == 1, f"Expected exit code 1 for platform '{platform}', got {returncode}"
+
+        # And: Should contain the platform-specific error message
+        assert f"Unsupported platform '{platform}'".encode() in output, \
+            f"Expected platform-specific error message not found in output for platform '{platform}'"
+
+        # And: Should mention that only Windows is supported
+        assert b"JiraUtil only supports Windows builds" in output, \
+            f"Should mention Windows-only support for platform '{platform}'"
+
+        # And: Should show the correct usage
+        assert b"Use: .\\scripts\\release.ps1 -Platform windows" in output, \
+            f"Should show correct usage for platform '{platform}'"
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__, "-m", "slow"])
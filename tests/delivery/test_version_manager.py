@@ -4,20 +4,13 @@ Tests for the version management system.
 Tests the 4-component version format (M.m.b.l) and all version operations.
 """
 
-import json
 import os
-import tempfile
+import subprocess
 import unittest
 from pathlib import Path
-import sys
-
-# Add tools directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools"))
-# Add tests directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from version_manager import VersionManager
-from tests.fixtures.base_fixtures import create_temp_version_file, create_version_manager_with_version
+from tests.fixtures.base_fixtures import create_temp_version_file
 
 
 class TestVersionManager(unittest.TestCase):
@@ -207,8 +200,6 @@ class TestVersionManagerCLI(unittest.TestCase):
     
     def test_get_command(self):
         """Test 'get' command returns 4-component version."""
-        import subprocess
-        
         # Given: Version file with specific version
         manager = VersionManager(str(self.version_file))
         manager.set_manual_version(1, 2)
@@ -227,8 +218,6 @@ class TestVersionManagerCLI(unittest.TestCase):
     
     def test_set_command(self):
         """Test 'set' command resets build and local to 0."""
-        import subprocess
-        
         # Given: Version file with some increments
         manager = VersionManager(str(self.version_file))
         manager.set_manual_version(1, 0)
@@ -248,8 +237,6 @@ class TestVersionManagerCLI(unittest.TestCase):
     
     def test_increment_local_command(self):
         """Test 'increment-local' command."""
-        import subprocess
-        
         # Given: Version file with initial version
         manager = VersionManager(str(self.version_file))
         manager.set_manual_version(1, 0)
@@ -5,6 +5,10 @@ This module contains the core test data and helper functions
 that are shared across different test contexts.
 """
 
+import json
+import os
+import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock
@@ -50,8 +54,6 @@ def create_field_extractor_rows(rows_data):
 
 def create_mock_code_change_detector(has_changes=True):
     """Create a mock code change detector for testing."""
-    from unittest.mock import Mock
-    
     mock_detector = Mock()
     mock_detector.has_code_changed.return_value = has_changes
     return mock_detector
@@ -117,7 +119,6 @@ JIRA_PASSWORD={password}"""
 
 def create_temp_version_file():
     """Create a temporary version file for testing."""
-    import os
     temp_dir = tempfile.mkdtemp()
     version_file = os.path.join(temp_dir, "test_version.json")
     return Path(version_file), temp_dir
@@ -125,9 +126,6 @@ def create_temp_version_file():
 
 def create_test_project_structure(temp_dir, project_name="test_project"):
     """Create a complete test project structure for build integration tests."""
-    import shutil
-    from pathlib import Path
-    
     project_root = Path(__file__).parent.parent.parent
     test_project_dir = Path(temp_dir) / project_name
     test_project_dir.mkdir(parents=True, exist_ok=True)
@@ -155,9 +153,6 @@ def create_test_project_structure(temp_dir, project_name="test_project"):
 
 def create_version_file_with_version(temp_dir, major=1, minor=0, build=0, local=0):
     """Create a version file with specific version components."""
-    import json
-    from pathlib import Path
-    
     version_file = Path(temp_dir) / "test_version.json"
     version_data = {
         "major": major,
@@ -175,11 +170,6 @@ def create_version_file_with_version(temp_dir, major=1, minor=0, build=0, local=
 
 def create_version_manager_with_version(major, minor, build=0, local=0):
     """Create a VersionManager with a specific version."""
-    import sys
-    from pathlib import Path
-    
-    # Add tools directory to path for imports
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools"))
     try:
         from version_manager import VersionManager  # type: ignore
     except ImportError:
@@ -211,8 +201,6 @@ JIRA_PASSWORD={password}"""
 
 def get_version_components(version_file):
     """Get version components from version file."""
-    import json
-    
     with open(version_file, 'r') as f:
         version_data = json.load(f)
     
@@ -226,8 +214,6 @@ def get_version_components(version_file):
 
 def get_version_from_file(version_file):
     """Get version string from version file."""
-    import json
-    
     with open(version_file, 'r') as f:
         version_data = json.load(f)
     
@@ -236,9 +222,6 @@ def get_version_from_file(version_file):
 
 def run_version_command(command, version_file, cwd=None):
     """Run a version manager command and return the result."""
-    import subprocess
-    from pathlib import Path
-    
     if cwd is None:
         cwd = Path(__file__).parent.parent.parent
     
@@ -5,6 +5,8 @@ This module contains complete test scenarios that group test data
 with expected results for test fixture operations.
 """
 
+from unittest.mock import Mock
+
 from .base_fixtures import create_mock_manager_with_expected_results
 
 # Test fixture issue data
@@ -77,7 +79,6 @@ def create_assert_result(processed=0, passed=0, failed=0, not_evaluated=0, failu
 
 def create_assert_scenario(issue_type="Story", issue_key="PROJ-1", summary="I have a dream", rank=None):
     """Create a custom assert scenario with specific issue parameters."""
-    from unittest.mock import Mock
     mock_manager = Mock()
     issue = {
         'key': issue_key,
@@ -212,8 +213,6 @@ class ResetScenarioBuilder:
     
     def create_scenario(self):
         """Create a mock manager with the configured scenario."""
-        from unittest.mock import Mock
-        
         # Generate summary if not provided
         if not self.summary:
             self.summary = f"I was in {self.starting_state} - expected to be in In Progress"
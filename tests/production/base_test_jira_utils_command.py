@@ -2,9 +2,9 @@
 Base test class for JiraUtils command testing.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import patch, Mock
+from unittest.mock import patch
+
+from src.JiraUtil import run_cli
 
 
 class TestJiraUtilsCommand:
@@ -14,15 +14,14 @@ class TestJiraUtilsCommand:
         """Setup mock credentials for testing."""
         mock_get_credentials.return_value = ('http://test.com', 'user', 'pass')
 
+    def _execute_JiraUtil_and_capture_output(self, capsys, mock_get_credentials, mock_jira_class, *args):
+        """Execute JiraUtil with real printing and return the stdout captured by capsys."""
+        self._execute_JiraUtil_with_args(mock_get_credentials, mock_jira_class, *args)
+        return capsys.readouterr().out
+
     def _execute_JiraUtil_with_args(self, mock_get_credentials, mock_jira_class, *args):
-        import sys
-        from pathlib import Path
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-        from JiraUtil import run_cli
-        
+        """Execute JiraUtil with real printing; output is left to pytest's capture."""
         with patch('sys.argv', ['JiraUtil.py'] + list(args)):
-            with patch('builtins.print') as mock_print:
-                with patch('testfixture_cli.handlers.get_jira_credentials', mock_get_credentials):
-                    with patch('testfixture_cli.handlers.JiraInstanceManager', mock_jira_class):
-                        run_cli()
-                        return mock_print
+            with patch('testfixture_cli.handlers.get_jira_credentials', mock_get_credentials):
+                with patch('testfixture_cli.handlers.JiraInstanceManager', mock_jira_class):
+                    run_cli()
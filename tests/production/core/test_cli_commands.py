@@ -3,26 +3,28 @@ Tests for CLI commands.
 """
 
 import pytest
-import sys
+import os
+import re
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, mock_open, MagicMock
-from io import StringIO
+from unittest.mock import patch, mock_open
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
-# Add tests directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
-from cli.parser import build_parser
 from cli.commands import show_list, show_status
 from version.manager import get_version
 from config.validator import check_config_file_for_template_values, get_config_file_status_message
-from tests.fixtures import (create_temp_config_file, create_temp_env_file, generate_env_content, 
-                       TEMPLATE_CONFIG_CONTENT, CONFIGURED_CONFIG_CONTENT, 
+from src.JiraUtil import run_cli
+from tests.fixtures import (create_temp_env_file,
                        CSV_EXPORT_COMMANDS, TEST_FIXTURE_SINGLE_COMMANDS, TEST_FIXTURE_CHAINED_COMMANDS, UTILITY_COMMANDS)
 
 
+VERSION_PATTERN = re.compile(r"Version: \d+\.\d+\.\d+")
+
+
+def _printed(mock_print, needle):
+    """Return True as soon as any captured print call contains the needle."""
+    return any(needle in str(call) for call in mock_print.call_args_list)
+
+
 class TestCLICommands:
     """Test CLI command functionality."""
     
@@ -31,32 +33,29 @@ class TestCLICommands:
         with patch('builtins.print') as mock_print:
             show_list()
         
-        printed_content = ' '.join([str(call) for call in mock_print.call_args_list])
-        
         # Verify all major command categories are displayed
         expected_sections = [
             "CSV Export Commands:", "Test Fixture Commands:", "Utility Commands:", "Short Aliases:"
         ]
         for section in expected_sections:
-            assert section in printed_content, f"Missing section: {section}"
+            assert _printed(mock_print, section), f"Missing section: {section}"
         
         # Verify specific commands
         expected_commands = [
             "csv-export remove-newlines", "test-fixture reset", "list", "status", "--version", "--help"
         ]
         for command in expected_commands:
-            assert command in printed_content, f"Missing command: {command}"
+            assert _printed(mock_print, command), f"Missing command: {command}"
         
         # Verify aliases
         expected_aliases = ["ce rn", "tf r", "ls", "st"]
         for alias in expected_aliases:
-            assert alias in printed_content, f"Missing alias: {alias}"
+            assert _printed(mock_print, alias), f"Missing alias: {alias}"
         
         # Verify formatting
         assert mock_print.call_count >= 20, "Should have multiple print statements for formatting"
-        printed_lines = [str(call) for call in mock_print.call_args_list]
-        assert any("=" in line for line in printed_lines), "Should have separator lines"
-        assert any("JiraUtil - Available Commands" in line for line in printed_lines), "Should have main header"
+        assert _printed(mock_print, "="), "Should have separator lines"
+        assert _printed(mock_print, "JiraUtil - Available Commands"), "Should have main header"
 
 
     def test_status_command_displays_basic_info(self):
@@ -65,43 +64,31 @@ class TestCLICommands:
              patch('version.manager.get_version', return_value="1.0.24"):
             show_status()
         
-        printed_content = ' '.join([str(call) for call in mock_print.call_args_list])
-        
         # Verify basic information is displayed
         expected_content = [
             "JiraUtil Status", "Status: Ready", "Configuration:", "Default test-set-label: rule-testing"
         ]
         for content in expected_content:
-            assert content in printed_content, f"Missing content: {content}"
+            assert _printed(mock_print, content), f"Missing content: {content}"
         
         # Test for version pattern
-        import re
-        version_pattern = r"Version: \d+\.\d+\.\d+"
-        assert re.search(version_pattern, printed_content), f"Version pattern not found in: {printed_content}"
+        assert any(VERSION_PATTERN.search(str(call)) for call in mock_print.call_args_list), \
+            f"Version pattern not found in: {mock_print.call_args_list}"
     
-    def test_status_command_config_scenarios(self):
-        """Test status command in different config scenarios."""
-        # Test executable mode (no config file)
-        with patch('builtins.print') as mock_print, \
-             patch('version.manager.get_version', return_value="1.0.24"), \
-             patch('version.manager.is_frozen', return_value=True), \
-             patch('pathlib.Path.exists', return_value=False):
-            show_status()
-        
-        printed_content = ' '.join([str(call) for call in mock_print.call_args_list])
-        assert "jira_config.env not found" in printed_content
-        assert "needs to be created" in printed_content
-        
-        # Test development mode (no config file)
-        with patch('builtins.print') as mock_print, \
-             patch('version.manager.get_version', return_value="1.0.24"), \
-             patch('version.manager.is_frozen', return_value=False), \
-             patch('pathlib.Path.exists', return_value=False):
+    @pytest.mark.parametrize("frozen,expected_messages", [
+        pytest.param(True, ["jira_config.env not found", "needs to be created"], id="executable"),
+        pytest.param(False, ["No config file found", ".venv/jira_config.env"], id="development"),
+    ])
+    @patch('pathlib.Path.exists', return_value=False)
+    @patch('version.manager.get_version', return_value="1.0.24")
+    @patch('builtins.print')
+    def test_status_command_config_scenarios(self, mock_print, mock_get_version, mock_exists, frozen, expected_messages):
+        """Test status command in executable and development mode without a config file."""
+        with patch('version.manager.is_frozen', return_value=frozen):
             show_status()
         
-        printed_content = ' '.join([str(call) for call in mock_print.call_args_list])
-        assert "No config file found" in printed_content
-        assert ".venv/jira_config.env" in printed_content
+        for message in expected_messages:
+            assert _printed(mock_print, message), f"Missing message: {message}"
 
 
     def test_version_command_scenarios(self):
@@ -122,66 +109,50 @@ class TestCLICommands:
             assert version == "unknown"
 
 
-    def test_parser_creation(self):
+    def test_parser_creation(self, cli_parser):
         """Test that argument parser is created correctly."""
-        parser = build_parser()
-        
-        assert parser.prog == "JiraUtil"
-        assert parser.description == "Jira utilities"
+        assert cli_parser.prog == "JiraUtil"
+        assert cli_parser.description == "Jira utilities"
         
         # Test that subcommands exist
-        subcommands = [action.dest for action in parser._actions if hasattr(action, 'dest') and action.dest == 'command']
+        subcommands = [action.dest for action in cli_parser._actions if hasattr(action, 'dest') and action.dest == 'command']
         assert 'command' in subcommands
     
-    def test_csv_export_command_parsing(self):
+    @pytest.mark.parametrize("args_list,expected_command,expected_subcommand,expected_input", CSV_EXPORT_COMMANDS)
+    def test_csv_export_command_parsing(self, cli_parser, args_list, expected_command, expected_subcommand, expected_input):
         """Test CSV export command parsing."""
-        parser = build_parser()
-        
-        for args_list, expected_command, expected_subcommand, expected_input in CSV_EXPORT_COMMANDS:
-            args = parser.parse_args(args_list)
-            assert args.command == expected_command
-            assert args.csv_command == expected_subcommand
-            assert args.input == expected_input
+        args = cli_parser.parse_args(args_list)
+        assert args.command == expected_command
+        assert args.csv_command == expected_subcommand
+        assert args.input == expected_input
     
-    def test_testfixture_single_command_parsing(self):
+    @pytest.mark.parametrize("args_list,expected_command,expected_subcommand,expected_label", TEST_FIXTURE_SINGLE_COMMANDS)
+    def test_testfixture_single_command_parsing(self, cli_parser, args_list, expected_command, expected_subcommand, expected_label):
         """Test test fixture single command parsing."""
-        parser = build_parser()
-        
-        for args_list, expected_command, expected_subcommand, expected_label in TEST_FIXTURE_SINGLE_COMMANDS:
-            args = parser.parse_args(args_list)
-            assert args.command == expected_command
-            assert args.commands == [expected_subcommand]
-            assert args.tsl == expected_label
+        args = cli_parser.parse_args(args_list)
+        assert args.command == expected_command
+        assert args.commands == [expected_subcommand]
+        assert args.tsl == expected_label
     
-    def test_testfixture_chained_command_parsing(self):
+    @pytest.mark.parametrize("args_list,expected_command,expected_subcommands,expected_label", TEST_FIXTURE_CHAINED_COMMANDS)
+    def test_testfixture_chained_command_parsing(self, cli_parser, args_list, expected_command, expected_subcommands, expected_label):
         """Test test fixture chained command parsing."""
-        parser = build_parser()
-        
-        for args_list, expected_command, expected_subcommands, expected_label in TEST_FIXTURE_CHAINED_COMMANDS:
-            args = parser.parse_args(args_list)
-            assert args.command == expected_command
-            assert args.commands == expected_subcommands
-            assert args.tsl == expected_label
+        args = cli_parser.parse_args(args_list)
+        assert args.command == expected_command
+        assert args.commands == expected_subcommands
+        assert args.tsl == expected_label
     
-    def test_utility_command_parsing(self):
+    @pytest.mark.parametrize("args_list,expected_command", UTILITY_COMMANDS)
+    def test_utility_command_parsing(self, cli_parser, args_list, expected_command):
         """Test utility command parsing."""
-        parser = build_parser()
-        
-        for args_list, expected_command in UTILITY_COMMANDS:
-            args = parser.parse_args(args_list)
-            assert args.command == expected_command
+        args = cli_parser.parse_args(args_list)
+        assert args.command == expected_command
     
-    def test_version_and_help_options(self):
+    @pytest.mark.parametrize("option", ['--version', '--help'])
+    def test_version_and_help_options(self, cli_parser, option):
         """Test version and help options."""
-        parser = build_parser()
-        
-        # Test version option
-        with pytest.raises(SystemExit):  # --version causes sys.exit
-            parser.parse_args(['--version'])
-        
-        # Test help option
-        with pytest.raises(SystemExit):  # --help causes sys.exit
-            parser.parse_args(['--help'])
+        with pytest.raises(SystemExit):  # --version and --help cause sys.exit
+            cli_parser.parse_args([option])
 
 
     def test_config_file_validation(self):
@@ -225,7 +196,6 @@ class TestCLICommands:
         # Test help command
         with patch('sys.argv', ['JiraUtil.py', '--help']):
             with patch('builtins.print'):
-                from src.JiraUtil import run_cli
                 try:
                     run_cli()
                     assert False, "Expected SystemExit for help command"
@@ -235,14 +205,12 @@ class TestCLICommands:
         # Test list command
         with patch('sys.argv', ['JiraUtil.py', 'list']):
             with patch('builtins.print') as mock_print:
-                from src.JiraUtil import run_cli
                 result = run_cli()
                 
                 assert result['command'] == 'list'
                 assert result['success'] == True
                 
-                printed_content = ' '.join([str(call) for call in mock_print.call_args_list])
-                assert "JiraUtil - Available Commands" in printed_content
+                assert _printed(mock_print, "JiraUtil - Available Commands")
         
         # Test status command
         with patch('sys.argv', ['JiraUtil.py', 'status']):
@@ -250,19 +218,14 @@ class TestCLICommands:
                  patch('version.manager.get_version', return_value="1.0.24"), \
                  patch('version.manager.is_frozen', return_value=False), \
                  patch('pathlib.Path.exists', return_value=False):
-                from src.JiraUtil import run_cli
                 result = run_cli()
                 
                 assert result['command'] == 'status'
                 assert result['success'] == True
                 
-                printed_content = ' '.join([str(call) for call in mock_print.call_args_list])
-                assert "JiraUtil Status" in printed_content
+                assert _printed(mock_print, "JiraUtil Status")
         
         # Test CSV export command
-        import tempfile
-        import os
-        
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
             temp_file.write("Name,Description\nTest,Line1\nLine2")
             temp_file_path = temp_file.name
@@ -270,7 +233,6 @@ class TestCLICommands:
         try:
             with patch('sys.argv', ['JiraUtil.py', 'csv-export', 'remove-newlines', temp_file_path]):
                 with patch('builtins.print'):
-                    from src.JiraUtil import run_cli
                     result = run_cli()
                     
                     assert result['command'] == 'csv-export'
@@ -5,367 +5,309 @@ This module provides high-level API tests that validate complete
 user workflows and application behavior from a user perspective.
 """
 
+import argparse
+import importlib
 import pytest
-import sys
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, Mock
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
-# Add tests directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
-from tests.fixtures import (
-    create_reset_result, 
-    create_assert_result,
-    create_temp_csv_file,
-    create_temp_env_file,
-    create_temp_config_file,
-    create_csv_with_embedded_newlines,
-    create_csv_for_field_extraction,
-    create_csv_with_iso_dates
-)
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-
-class TestJiraUtilAPI:
-    """API-focused tests for JiraUtil user workflows."""
+import re
+from contextlib import nullcontext
+from unittest.mock import Mock
+
+from tests.fixtures import generate_env_content
+
+from jira_cleaner import run_remove_newlines
+from csv_utils import run_extract_field_values
+from jira_dates_eu import run as run_jira_dates_eu
+from testfixture.workflow import run_TestFixture_Reset, run_assert_expectations
+from cli.commands import show_list, show_status
+from config.validator import check_config_file_for_template_values
+from auth.credentials import load_env_file, get_jira_credentials
+
+
+VERSION_PATTERN = re.compile(r"Version: \d+\.\d+\.\d+")
+
+# CSV processing cases: (scenario, sample CSV name, processing call, output file suffix)
+CSV_PROCESSING_CASES = [
+    ("remove newlines", "embedded-newlines", lambda path: run_remove_newlines(path, None), "-no-newlines.csv"),
+    ("extract field values", "field-extraction", lambda path: run_extract_field_values(path, "Status", None), "-status.txt"),
+    ("convert dates", "iso-dates", lambda path: run_jira_dates_eu(path, None), "-eu-dates.csv"),
+]
+
+# Large file processing cases: (processing call, output file suffix)
+# Small inputs for the same processors are covered by CSV_PROCESSING_CASES, so these only run with the slow tests
+LARGE_FILE_PROCESSING_CASES = [
+    pytest.param(lambda path: run_remove_newlines(path, None), "-no-newlines.csv", id="remove-newlines"),
+    pytest.param(lambda path: run_extract_field_values(path, "Status", None), "-status.txt", id="extract-status"),
+    pytest.param(lambda path: run_jira_dates_eu(path, None), "-eu-dates.csv", id="convert-dates"),
+]
+
+LARGE_CSV_ROW_COUNT = 100
+
+# Error handling cases: (scenario, CSV content or None for a missing file, processing call, expected error, expected output)
+ERROR_HANDLING_CASES = [
+    ("nonexistent file", None, lambda path: run_remove_newlines(path, None), FileNotFoundError, []),
+    ("missing field", "Issue key,Summary\nPROJ-1,Test", lambda path: run_extract_field_values(path, "Nonexistent Field", None), None, ["Warning", "not found"]),
+    ("empty file", "", lambda path: run_jira_dates_eu(path, None), None, []),
+]
+
+# Modules making up the modular architecture
+# - Core modules: auth, version, config, cli
+# - Feature modules: testfixture, csv_utils
+# - Backward compatibility modules: jira_field_extractor, jira_testfixture
+MODULES = [
+    "auth.credentials",
+    "version.manager",
+    "config.validator",
+    "cli.parser",
+    "cli.commands",
+    "testfixture.patterns",
+    "testfixture.issue_processor",
+    "testfixture.reporter",
+    "testfixture.workflow",
+    "csv_utils.field_matcher",
+    "csv_utils.field_extractor",
+    "jira_field_extractor",
+    "jira_testfixture",
+]
+
+# Main functionality exposed by the backward compatibility modules: (module, function)
+MODULE_FUNCTIONS = [
+    ("jira_field_extractor", "run_extract_field_values"),
+    ("jira_testfixture", "run_TestFixture_Reset"),
+    ("jira_testfixture", "run_assert_expectations"),
+]
+
+# CLI commands and csv-export subcommands users can run, including short aliases
+CLI_COMMAND_NAMES = ['csv-export', 'ce', 'test-fixture', 'tf', 'list', 'ls', 'status', 'st']
+CSV_EXPORT_SUBCOMMAND_NAMES = ['remove-newlines', 'rn', 'extract-to-comma-separated-list', 'ecl', 'fix-dates-eu', 'fd']
+
+# CLI commands users can parse end-to-end, including short aliases
+CLI_COMMANDS = [
+    ['csv-export', 'remove-newlines', 'input.csv'],
+    ['ce', 'rn', 'input.csv'],
+    ['test-fixture', 'reset', 'custom-label'],
+    ['tf', 'r'],
+    ['list'],
+    ['status'],
+]
+
+
+def _get_subcommand_choices(parser):
+    """Return the parser's registered subcommands (including aliases) by name."""
+    subparsers_action = next(action for action in parser._actions if isinstance(action, argparse._SubParsersAction))
+    return subparsers_action.choices
+
+
+@pytest.fixture
+def mock_get_issues(monkeypatch):
+    """Patch issue lookup for the reset and assert processors with one mock returning no issues."""
+    mock_get_issues = Mock(return_value={'success': True, 'issues': []})
+    for processor_module in ('testfixture.reset_processor', 'testfixture.assert_processor'):
+        monkeypatch.setattr(f'{processor_module}._get_issues_for_processing', mock_get_issues)
+    return mock_get_issues
+
+
+@pytest.mark.parametrize("scenario,sample_csv_name,process_csv_file,output_suffix", CSV_PROCESSING_CASES)
+def test_user_can_process_csv_files(sample_csv_files, copy_csv_to_tmp_path, scenario, sample_csv_name, process_csv_file, output_suffix):
+    """Test that users can process CSV files through the API."""
+    # Given: A CSV file that needs processing
+    input_csv_file = copy_csv_to_tmp_path(sample_csv_files[sample_csv_name])
+    
+    # When: User processes the CSV file through API
+    process_csv_file(input_csv_file)
+    
+    # Then: Processing should complete successfully and create the output file
+    output_file = input_csv_file.with_name(f"{input_csv_file.stem}{output_suffix}")
+    assert output_file.exists(), f"Output file should be created for scenario: {scenario}"
+
+
+def test_user_can_reset_test_fixtures(mock_manager, mock_get_issues):
+    """Test that users can reset test fixtures through the API."""
+    # Given: Test fixture reset workflow function and mock Jira instance
+    # - Issue lookup patched to return no issues (see mock_get_issues)
+    
+    # When: User runs test fixture reset operation
+    run_TestFixture_Reset(mock_manager, "rule-testing")
+    
+    # Then: Should call appropriate functions
+    mock_get_issues.assert_called_once_with(mock_manager, "rule-testing")
+
+
+def test_user_can_assert_test_fixtures(mock_manager, mock_get_issues):
+    """Test that users can assert test fixture expectations through the API."""
+    # Given: Test fixture assert workflow function and mock Jira instance
+    # - Issue lookup patched to return no issues (see mock_get_issues)
+    
+    # When: User runs test fixture assert operation
+    run_assert_expectations(mock_manager, "rule-testing")
     
-    def test_user_can_process_csv_files(self):
-        """Test that users can process CSV files through the API."""
-        # Given: A CSV file with formatting issues that need processing
-        csv_file_with_embedded_newlines = create_temp_csv_file(create_csv_with_embedded_newlines())
-        
-        # And: Import the required processing functions
-        from jira_cleaner import run_remove_newlines
-        from csv_utils import run_extract_field_values
-        from jira_dates_eu import run as run_jira_dates_eu
-        
-        try:
-            # When: User processes the CSV file through API
-            run_remove_newlines(csv_file_with_embedded_newlines, None)
-            
-            # Then: Newlines processing should complete successfully
-            newlines_output_file = csv_file_with_embedded_newlines.with_name(f"{csv_file_with_embedded_newlines.stem}-no-newlines.csv")
-            assert newlines_output_file.exists()
-            
-        finally:
-            # Cleanup
-            csv_file_with_embedded_newlines.unlink(missing_ok=True)
-            if 'newlines_output_file' in locals():
-                newlines_output_file.unlink(missing_ok=True)
+    # Then: Should call appropriate functions
+    mock_get_issues.assert_called_once_with(mock_manager, "rule-testing")
+
+
+def test_user_can_find_cli_commands(cli_parser):
+    """Test that all CLI commands and aliases are registered with the parser."""
+    # Given: CLI parser configured with all available commands
+    # When: User looks up the registered commands and csv-export subcommands
+    command_choices = _get_subcommand_choices(cli_parser)
+    csv_export_choices = _get_subcommand_choices(command_choices['csv-export'])
     
-    def test_user_can_extract_field_values_from_csv(self):
-        """Test that users can extract field values from CSV files."""
-        # Given: A CSV file with structured data for field extraction
-        csv_file_for_field_extraction = create_temp_csv_file(create_csv_for_field_extraction())
-        
-        # And: Import the required processing function
-        from csv_utils import run_extract_field_values
-        
-        try:
-            # When: User extracts field values from the CSV file
-            run_extract_field_values(csv_file_for_field_extraction, "Status", None)
-            
-            # Then: Field extraction should complete successfully
-            field_extraction_output_file = csv_file_for_field_extraction.with_name(f"{csv_file_for_field_extraction.stem}-status.txt")
-            assert field_extraction_output_file.exists()
-            
-        finally:
-            # Cleanup
-            csv_file_for_field_extraction.unlink(missing_ok=True)
-            if 'field_extraction_output_file' in locals():
-                field_extraction_output_file.unlink(missing_ok=True)
+    # Then: Every command and alias should be registered
+    assert set(CLI_COMMAND_NAMES) <= set(command_choices), f"Missing commands in: {list(command_choices)}"
+    assert set(CSV_EXPORT_SUBCOMMAND_NAMES) <= set(csv_export_choices), f"Missing csv-export subcommands in: {list(csv_export_choices)}"
+
+
+@pytest.mark.parametrize("command", CLI_COMMANDS)
+def test_user_can_parse_cli_commands(cli_parser, command):
+    """Test that users can parse CLI commands through the API."""
+    # Given: CLI parser configured with all available commands
+    # When: User parses the command
+    args = cli_parser.parse_args(command)
     
-    def test_user_can_convert_dates_in_csv(self):
-        """Test that users can convert date formats in CSV files."""
-        # Given: A CSV file with ISO date formats that need conversion
-        csv_file_with_iso_dates = create_temp_csv_file(create_csv_with_iso_dates())
-        
-        # And: Import the required processing function
-        from jira_dates_eu import run as run_jira_dates_eu
-        
-        try:
-            # When: User converts dates in the CSV file
-            run_jira_dates_eu(csv_file_with_iso_dates, None)
-            
-            # Then: Date conversion should complete successfully
-            date_conversion_output_file = csv_file_with_iso_dates.with_name(f"{csv_file_with_iso_dates.stem}-eu-dates.csv")
-            assert date_conversion_output_file.exists()
-            
-        finally:
-            # Cleanup
-            csv_file_with_iso_dates.unlink(missing_ok=True)
-            if 'date_conversion_output_file' in locals():
-                date_conversion_output_file.unlink(missing_ok=True)
+    # Then: Command should parse successfully
+    assert args.command is not None, f"Command parsing failed for: {command}"
+
+
+def test_user_can_run_list_command(capsys):
+    """Test that users can run the list command through the API."""
+    # Given: List command function
+    # When: User runs list command
+    show_list()
     
-    def test_user_can_reset_test_fixtures(self):
-        """Test that users can reset test fixtures through the API."""
-        # Given: Test fixture reset workflow function and mock Jira instance
-        from testfixture.workflow import run_TestFixture_Reset
-        
-        # When: User runs test fixture reset operation
-        with patch('testfixture.reset_processor._get_issues_for_processing') as mock_get_issues:
-            
-            mock_manager = Mock()
-            mock_get_issues.return_value = {'success': True, 'issues': []}
-            
-            with patch('builtins.print'):
-                run_TestFixture_Reset(mock_manager, "rule-testing")
-            
-            # Then: Should call appropriate functions
-            mock_get_issues.assert_called_once_with(mock_manager, "rule-testing")
+    # Then: Should display all command categories
+    printed_content = capsys.readouterr().out
+    assert "CSV Export Commands:" in printed_content
+    assert "Test Fixture Commands:" in printed_content
+    assert "Utility Commands:" in printed_content
+    assert "Short Aliases:" in printed_content
+
+
+def test_user_can_run_status_command(capsys):
+    """Test that users can run the status command through the API."""
+    # Given: Status command function
+    # When: User runs status command
+    show_status()
     
-    def test_user_can_assert_test_fixtures(self):
-        """Test that users can assert test fixture expectations through the API."""
-        # Given: Test fixture assert workflow function and mock Jira instance
-        from testfixture.workflow import run_assert_expectations
-        
-        # When: User runs test fixture assert operation
-        with patch('testfixture.assert_processor._get_issues_for_processing') as mock_get_issues:
-            
-            mock_manager = Mock()
-            mock_get_issues.return_value = {'success': True, 'issues': []}
-            
-            with patch('builtins.print'):
-                run_assert_expectations(mock_manager, "rule-testing")
-            
-            # Then: Should call appropriate functions
-            mock_get_issues.assert_called_once_with(mock_manager, "rule-testing")
+    # Then: Should display status information
+    printed_content = capsys.readouterr().out
+    assert "JiraUtil Status" in printed_content
+    assert VERSION_PATTERN.search(printed_content)
+    assert "Status: Ready" in printed_content
+
+
+def test_user_can_get_version(cached_version):
+    """Test that users can get version information through the API."""
+    # Given: Version manager function
+    # When: User checks version (resolved once per session)
+    version = cached_version
     
-    def test_user_can_parse_cli_commands(self):
-        """Test that users can parse CLI commands through the API."""
-        # Given: CLI parser configured with all available commands
-        from cli.parser import build_parser
-        
-        # When: User parses various commands
-        parser = build_parser()
-        test_commands = [
-            ['csv-export', 'remove-newlines', 'input.csv'],
-            ['ce', 'rn', 'input.csv'],
-            ['test-fixture', 'reset', 'custom-label'],
-            ['tf', 'r'],
-            ['list'],
-            ['status']
-        ]
-        
-        # Then: All commands should parse successfully
-        for cmd in test_commands:
-            args = parser.parse_args(cmd)
-            assert args.command is not None, f"Command parsing failed for: {cmd}"
+    # Then: Should return valid version
+    assert version is not None
+    assert version != ""
+
+
+def test_user_can_validate_configuration(tmp_path):
+    """Test that users can validate configuration through the API."""
+    # Given: Configuration validator and template configuration file
+    # - Template config contains placeholder values that need to be replaced
+    # - Validator function that can detect template patterns
+    # - Expected behavior: should identify template values and provide guidance
     
-    def test_user_can_run_list_command(self):
-        """Test that users can run the list command through the API."""
-        # Given: List command function
-        from cli.commands import show_list
-        
-        # When: User runs list command
-        with patch('builtins.print') as mock_print:
-            show_list()
-        
-        # Then: Should display all command categories
-        printed_content = ' '.join([str(call) for call in mock_print.call_args_list])
-        assert "CSV Export Commands:" in printed_content
-        assert "Test Fixture Commands:" in printed_content
-        assert "Utility Commands:" in printed_content
-        assert "Short Aliases:" in printed_content
+    # When: User validates template configuration
+    template_content = "# Jira Configuration\nJIRA_URL=https://yourcompany.atlassian.net\nJIRA_USERNAME=your.email@example.com\nJIRA_PASSWORD=your_api_token"
+    config_path = tmp_path / "jira_config.env"
+    config_path.write_text(template_content)
+    has_template, message = check_config_file_for_template_values(config_path)
     
-    def test_user_can_run_status_command(self):
-        """Test that users can run the status command through the API."""
-        # Given: Status command function
-        from cli.commands import show_status
-        
-        # When: User runs status command
-        with patch('builtins.print') as mock_print:
-            show_status()
-        
-        # Then: Should display status information
-        printed_content = ' '.join([str(call) for call in mock_print.call_args_list])
-        assert "JiraUtil Status" in printed_content
-        import re
-        version_pattern = r"Version: \d+\.\d+\.\d+"
-        assert re.search(version_pattern, printed_content)
-        assert "Status: Ready" in printed_content
+    # Then: Should detect template values
+    assert has_template is True
+    assert "template values" in message
+
+
+def test_user_can_manage_authentication(tmp_path, monkeypatch):
+    """Test that users can manage authentication through the API."""
+    # Given: Authentication functions and test environment file
+    # - Environment file with valid Jira credentials for testing
+    # - Functions for loading environment files and getting credentials
+    # - Mock input functions to simulate user interaction
     
-    def test_user_can_get_version(self):
-        """Test that users can get version information through the API."""
-        # Given: Version manager function
-        from version.manager import get_version
-        
-        # When: User checks version
-        version = get_version()
-        
-        # Then: Should return valid version
-        assert version is not None
-        assert version != ""
+    # When: User loads environment file
+    env_path = tmp_path / "jira_config.env"
+    env_path.write_text(generate_env_content("https://test.atlassian.net", "test@example.com", "test_token"))
+    load_env_file(env_path)
+    # Then: Should load without errors
+    # Note: We can't easily test os.environ changes in unit tests
+    # but we can verify the function doesn't crash
     
-    def test_user_can_validate_configuration(self):
-        """Test that users can validate configuration through the API."""
-        # Given: Configuration validator and template configuration file
-        # - Template config contains placeholder values that need to be replaced
-        # - Validator function that can detect template patterns
-        # - Expected behavior: should identify template values and provide guidance
-        from config.validator import check_config_file_for_template_values
-        
-        # When: User validates template configuration
-        template_content = "# Jira Configuration\nJIRA_URL=https://yourcompany.atlassian.net\nJIRA_USERNAME=your.email@example.com\nJIRA_PASSWORD=your_api_token"
-        config_path = create_temp_config_file(template_content)
-        
-        try:
-            has_template, message = check_config_file_for_template_values(config_path)
-            
-            # Then: Should detect template values
-            assert has_template is True
-            assert "template values" in message
-        finally:
-            config_path.unlink(missing_ok=True)
+    # When: User gets credentials interactively
+    user_inputs = iter(['https://test.atlassian.net', 'test@example.com'])
+    monkeypatch.setattr('builtins.input', lambda *args: next(user_inputs))
+    monkeypatch.setattr('getpass.getpass', lambda *args: 'test_token')
+    monkeypatch.setattr('os.getenv', lambda *args, **kwargs: None)
     
-    def test_user_can_manage_authentication(self):
-        """Test that users can manage authentication through the API."""
-        # Given: Authentication functions and test environment file
-        # - Environment file with valid Jira credentials for testing
-        # - Functions for loading environment files and getting credentials
-        # - Mock input functions to simulate user interaction
-        from auth.credentials import load_env_file, get_jira_credentials
-        
-        # When: User loads environment file
-        env_path = create_temp_env_file("https://test.atlassian.net", "test@example.com", "test_token")
-        
-        try:
-            load_env_file(env_path)
-            # Then: Should load without errors
-            # Note: We can't easily test os.environ changes in unit tests
-            # but we can verify the function doesn't crash
-        finally:
-            Path(env_path).unlink(missing_ok=True)
-        
-        # When: User gets credentials interactively
-        with patch('builtins.input', side_effect=['https://test.atlassian.net', 'test@example.com']), \
-             patch('getpass.getpass', return_value='test_token'), \
-             patch('os.getenv', return_value=None):
-            
-            url, username, password = get_jira_credentials()
-            
-            # Then: Should return correct credentials
-            assert url == 'https://test.atlassian.net'
-            assert username == 'test@example.com'
-            assert password == 'test_token'
+    url, username, password = get_jira_credentials()
     
-    def test_user_can_access_all_modules(self):
-        """Test that users can access all modules through the API."""
-        # Given: Modular architecture with all required modules available
-        # - Core modules: auth, version, config, cli
-        # - Feature modules: testfixture, csv_utils
-        # - Backward compatibility modules: jira_field_extractor, jira_testfixture
-        # When: User imports all modules
-        import auth.credentials
-        import version.manager
-        import config.validator
-        import cli.parser
-        import cli.commands
-        import testfixture.patterns
-        import testfixture.issue_processor
-        import testfixture.reporter
-        import testfixture.workflow
-        import csv_utils.field_matcher
-        import csv_utils.field_extractor
-        
-        # When: User imports backward compatibility modules
-        import jira_field_extractor
-        import jira_testfixture
-        
-        # When: User accesses main functionality
-        from jira_field_extractor import run_extract_field_values
-        from jira_testfixture import run_TestFixture_Reset, run_assert_expectations
-        
-        # Then: All modules should be accessible and callable
-        assert callable(run_extract_field_values)
-        assert callable(run_TestFixture_Reset)
-        assert callable(run_assert_expectations)
+    # Then: Should return correct credentials
+    assert url == 'https://test.atlassian.net'
+    assert username == 'test@example.com'
+    assert password == 'test_token'
+
+
+@pytest.mark.parametrize("module_name", MODULES)
+def test_user_can_access_all_modules(module_name):
+    """Test that users can access all modules through the API."""
+    # Given: Modular architecture with the module available
+    # When: User imports the module
+    module = importlib.import_module(module_name)
+    
+    # Then: Module should be accessible
+    assert module is not None
+
+
+@pytest.mark.parametrize("module_name,function_name", MODULE_FUNCTIONS)
+def test_user_can_access_main_functionality(module_name, function_name):
+    """Test that users can access main functionality through backward compatibility modules."""
+    # Given: Backward compatibility module
+    module = importlib.import_module(module_name)
+    
+    # When: User accesses main functionality
+    function = getattr(module, function_name)
+    
+    # Then: Function should be callable
+    assert callable(function)
+
+
+@pytest.mark.parametrize("scenario,csv_content,process_csv_file,expected_error,expected_output", ERROR_HANDLING_CASES)
+def test_user_gets_appropriate_error_handling(tmp_path, capsys, scenario, csv_content, process_csv_file, expected_error, expected_output):
+    """Test that users get appropriate error handling through the API."""
+    # Given: An input file for the error scenario (not created when csv_content is None)
+    input_csv_file = tmp_path / "input.csv"
+    if csv_content is not None:
+        input_csv_file.write_text(csv_content)
+    
+    # When: User processes the file
+    # Then: Should raise the expected error or handle the scenario gracefully
+    with pytest.raises(expected_error) if expected_error else nullcontext():
+        process_csv_file(input_csv_file)
+    
+    # And: Should print the expected messages
+    printed_content = capsys.readouterr().out
+    for message in expected_output:
+        assert message in printed_content, f"Missing '{message}' for scenario: {scenario}"
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("process_csv_file,output_suffix", LARGE_FILE_PROCESSING_CASES)
+def test_user_can_process_large_files(large_csv_files, copy_csv_to_tmp_path, process_csv_file, output_suffix):
+    """Test that users can process large files through the API."""
+    # Given: A large CSV file with LARGE_CSV_ROW_COUNT rows of test data (see large_csv_files)
+    large_csv_file = copy_csv_to_tmp_path(large_csv_files(LARGE_CSV_ROW_COUNT))
     
-    def test_user_gets_appropriate_error_handling(self):
-        """Test that users get appropriate error handling through the API."""
-        # Given: API functions and various error scenarios
-        # - Functions that can handle file operations and field extraction
-        # - Test cases for nonexistent files, missing fields, and empty files
-        # - Expected behavior: graceful error handling with appropriate messages
-        from jira_cleaner import run_remove_newlines
-        from csv_utils import run_extract_field_values
-        from jira_dates_eu import run as run_jira_dates_eu
-        
-        # When: User tries to process nonexistent file
-        nonexistent_file = Path("nonexistent_file.csv")
-        
-        # Then: Should raise appropriate error
-        with pytest.raises(FileNotFoundError):
-            run_remove_newlines(nonexistent_file, None)
-        
-        # When: User tries to extract nonexistent field
-        temp_path = create_temp_csv_file("Issue key,Summary\nPROJ-1,Test")
-        
-        try:
-            with patch('builtins.print') as mock_print:
-                run_extract_field_values(temp_path, "Nonexistent Field", None)
-                
-                # Then: Should print warning
-                printed_content = ' '.join([str(call) for call in mock_print.call_args_list])
-                assert "Warning" in printed_content
-                assert "not found" in printed_content
-        finally:
-            temp_path.unlink(missing_ok=True)
-        
-        # When: User processes empty file
-        temp_path = create_temp_csv_file("")
-        
-        try:
-            # Then: Should handle gracefully
-            run_jira_dates_eu(temp_path, None)
-        finally:
-            temp_path.unlink(missing_ok=True)
+    # When: User processes large file
+    process_csv_file(large_csv_file)
     
-    def test_user_can_process_large_files(self):
-        """Test that users can process large files through the API."""
-        # Given: A large CSV file with 100 rows of test data
-        # - Each row contains: Issue key, Summary, Parent key, Status, Assignee
-        # - Data is structured to test performance with realistic volume
-        # - Parent keys are grouped (EPIC-0 to EPIC-9) to test field extraction
-        # - Status values cycle through 3 different states
-        # - Assignee values cycle through 5 different users
-        large_csv_content = "Issue key,Summary,Parent key,Status,Assignee\n"
-        for i in range(100):  # 100 rows of test data
-            large_csv_content += f"PROJ-{i},Task {i},EPIC-{i//10},Status {i%3},User {i%5}\n"
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
-            temp_file.write(large_csv_content)
-            temp_path = Path(temp_file.name)
-        
-        try:
-            # When: User processes large file
-            from jira_cleaner import run_remove_newlines
-            from csv_utils import run_extract_field_values
-            from jira_dates_eu import run as run_jira_dates_eu
-            
-            run_remove_newlines(temp_path, None)
-            run_extract_field_values(temp_path, "Status", None)
-            run_jira_dates_eu(temp_path, None)
-            
-            # Then: Should complete successfully and create output files
-            newlines_output = temp_path.with_name(f"{temp_path.stem}-no-newlines.csv")
-            status_output = temp_path.with_name(f"{temp_path.stem}-status.txt")
-            dates_output = temp_path.with_name(f"{temp_path.stem}-eu-dates.csv")
-            
-            assert newlines_output.exists()
-            assert status_output.exists()
-            assert dates_output.exists()
-            
-        finally:
-            temp_path.unlink(missing_ok=True)
-            newlines_output.unlink(missing_ok=True)
-            status_output.unlink(missing_ok=True)
-            dates_output.unlink(missing_ok=True)
+    # Then: Should complete successfully and create a non-empty output file
+    output_file = large_csv_file.with_name(f"{large_csv_file.stem}{output_suffix}")
+    assert output_file.stat().st_size > 0, f"Output file should not be empty: {output_file.name}"
 
 
 if __name__ == "__main__":
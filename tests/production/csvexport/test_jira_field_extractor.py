@@ -1,11 +1,4 @@
 import pytest
-import sys
-from pathlib import Path
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
-# Add tests directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from csv_utils.field_matcher import find_field_index
 from csv_utils.field_extractor import (
@@ -15,37 +8,30 @@ from csv_utils.field_extractor import (
 from tests.fixtures.base_fixtures import create_field_extractor_rows
 
 
+# CSV headers shared by the find_field_index cases (read-only)
+HEADER = ["Issue key", "Summary", "Parent key", "Status"]
+HEADER_LOWERCASE_PARENT = ["Issue key", "Summary", "parent key", "Status"]
+HEADER_PADDED_PARENT = ["Issue key", "Summary", " Parent key ", "Status"]
+HEADER_WITHOUT_PARENT = ["Issue key", "Summary", "Status"]
+
+
 class TestFindFieldIndex:
 	"""Test the find_field_index function."""
 	
-	def test_exact_match(self):
-		"""Test finding field with exact match."""
-		header = ["Issue key", "Summary", "Parent key", "Status"]
-		assert find_field_index(header, "Parent key") == 2
-		assert find_field_index(header, "Status") == 3
-	
-	def test_case_insensitive_match(self):
-		"""Test finding field with case insensitive match."""
-		header = ["Issue key", "Summary", "parent key", "Status"]
-		assert find_field_index(header, "Parent key") == 2
-		assert find_field_index(header, "status") == 3
-	
-	def test_whitespace_trimmed_match(self):
-		"""Test finding field with whitespace trimmed."""
-		header = ["Issue key", "Summary", " Parent key ", "Status"]
-		assert find_field_index(header, "Parent key") == 2
-		assert find_field_index(header, " Status ") == 3
-	
-	def test_not_found(self):
-		"""Test when field column is not found."""
-		header = ["Issue key", "Summary", "Status"]
-		assert find_field_index(header, "Parent key") is None
-		assert find_field_index(header, "Assignee") is None
-	
-	def test_empty_header(self):
-		"""Test with empty header."""
-		header = []
-		assert find_field_index(header, "Parent key") is None
+	@pytest.mark.parametrize("header,field_name,expected_index", [
+		pytest.param(HEADER, "Parent key", 2, id="exact-match"),
+		pytest.param(HEADER, "Status", 3, id="exact-match-last"),
+		pytest.param(HEADER_LOWERCASE_PARENT, "Parent key", 2, id="case-insensitive-header"),
+		pytest.param(HEADER_LOWERCASE_PARENT, "status", 3, id="case-insensitive-field"),
+		pytest.param(HEADER_PADDED_PARENT, "Parent key", 2, id="whitespace-trimmed-header"),
+		pytest.param(HEADER_PADDED_PARENT, " Status ", 3, id="whitespace-trimmed-field"),
+		pytest.param(HEADER_WITHOUT_PARENT, "Parent key", None, id="not-found"),
+		pytest.param(HEADER_WITHOUT_PARENT, "Assignee", None, id="not-found-other"),
+		pytest.param([], "Parent key", None, id="empty-header"),
+	])
+	def test_find_field_index(self, header, field_name, expected_index):
+		"""Test finding a field column by exact, case-insensitive or trimmed name."""
+		assert find_field_index(header, field_name) == expected_index
 
 
 class TestExtractFieldValuesFromRows:
@@ -1,9 +1,4 @@
 import pytest
-import sys
-from pathlib import Path
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
 
 from cli.parser import validate_label_format, format_label_validation_error
 
@@ -2,39 +2,95 @@
 Tests for test fixture assert operations.
 """
 
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
-# Add tests directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-
 import pytest
-from unittest.mock import Mock, patch
-from enum import Enum
+import re
+from unittest.mock import patch
 
 from src.jira_manager import DEFAULT_RANK_VALUE
+from tests.fixtures import create_mock_manager
 from tests.production.base_test_jira_utils_command import TestJiraUtilsCommand
 
 
-class RankValues(Enum):
-    """Jira rank values used in test fixtures."""
-    
-    HIGHEST = "0|f0000:"
-    HIGHER = "0|h0000:"
-    HIGH = "0|i0000:"
-    MID = "0|i0001:"
-    LOW = "0|i0002:"
-    LOWER = "0|i0003:"
-    NO_RANK = DEFAULT_RANK_VALUE  # JIRA's actual default rank value
+# Jira rank values used in test fixtures
+HIGHEST_RANK = "0|f0000:"
+HIGHER_RANK = "0|h0000:"
+HIGH_RANK = "0|i0000:"
+MID_RANK = "0|i0001:"
+LOW_RANK = "0|i0002:"
+LOWER_RANK = "0|i0003:"
+NO_RANK = DEFAULT_RANK_VALUE  # JIRA's actual default rank value
+
+# ANSI color escape sequences stripped from captured output
+ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
+
+# Whole Jira issue keys (PROJ-1, TAPS-211) in captured output
+ISSUE_KEY_PATTERN = re.compile(r'\b[A-Z][A-Z0-9]*-\w+')
+
+# Summary that matches no assertion pattern, so the issue is not evaluated
+SKIPPED_SUMMARY = "Skipped issue"
+
+# Evaluable summary structures, alternated across the issues of a scenario
+SUMMARY_TEMPLATES = (
+    "{context_prefix}starting in {current_state} - expected to be in {expected_state}",
+    "{context_prefix}I was in {current_state} - expected to be in {expected_state}",
+)
+
+
+class AssertCommandScenarios(TestJiraUtilsCommand):
+    """Scenario helpers shared by the assert test classes; not collected itself."""
+
+    # =============================================================================
+    # PRIVATE HELPER METHODS (sorted alphabetically)
+    # =============================================================================
+
+    def _create_issue_from_spec(self, spec, i):
+        # Build issue data whose summary makes the assertion skip, pass or fail (the default)
+        assert_result = spec.get('assert_result')
+        current_state = spec.get('current', 'New')
+        if assert_result == 'Skip':
+            return self._create_issue_data(spec, SKIPPED_SUMMARY, current_state)
+        expected_state = spec.get('expected', 'Done')
+        if assert_result == 'Pass':
+            expected_state = current_state
+        elif current_state == expected_state:  # Ensure they're different to trigger assertion failure
+            expected_state = 'Ready' if current_state == 'New' else 'Done'
+        context_prefix = self._extract_context_prefix_from_spec(spec)
+        summary = self._generate_summary(context_prefix, current_state, expected_state, i)
+        return self._create_issue_data(spec, summary, current_state)
+
+    def _create_issue_data(self, spec, summary, current_state):
+        return {
+            'key': spec['key'],
+            'summary': summary,
+            'status': current_state,
+            'issue_type': spec.get('issue_type', 'Story'),
+            'parent_key': spec.get('parent_key'),
+            'rank': spec.get('rank', HIGH_RANK)
+        }
+
+    def _create_scenario_with_issues_from_assertion_specs(self, mock_get_credentials, mock_jira_class, issue_specs):
+        # Setup mock credentials
+        self._setup_mock_credentials(mock_get_credentials)
+        
+        issue_data_list = [self._create_issue_from_spec(spec, i) for i, spec in enumerate(issue_specs)]
+        
+        mock_jira_instance = create_mock_manager(issues=issue_data_list)
+        mock_jira_class.return_value = mock_jira_instance
+        return mock_jira_instance
 
+    def _extract_context_prefix_from_spec(self, spec):
+        context = spec.get('context')
+        if context is None and spec.get('issue_type') is not None:
+            context = f"{spec.get('issue_type')}"
+        return f"{context} - " if context else ""
 
-# Convenience access to rank values
-RANKS = RankValues
+    def _generate_summary(self, context_prefix, current_state, expected_state, index):
+        """Randomize the summary to use all possible valid evaluatable summary structures."""
+        summary_template = SUMMARY_TEMPLATES[index % len(SUMMARY_TEMPLATES)]
+        return summary_template.format(context_prefix=context_prefix, current_state=current_state, expected_state=expected_state)
 
 
-class TestTestFixtureAssert(TestJiraUtilsCommand):
+class TestTestFixtureAssert(AssertCommandScenarios):
     # =============================================================================
     # PUBLIC TEST METHODS (sorted alphabetically)
     # =============================================================================
@@ -62,21 +118,20 @@ class TestTestFixtureAssert(TestJiraUtilsCommand):
     ])
     @patch('testfixture_cli.handlers.JiraInstanceManager')
     @patch('testfixture_cli.handlers.get_jira_credentials')
-    def test_assert_failure_message_extracts_context_and_states(self, mock_get_credentials, mock_jira_class, scenario, summary, current_state, expected_context, expected_start_state, expected_end_state):
+    def test_assert_failure_message_extracts_context_and_states(self, mock_get_credentials, mock_jira_class, capsys, scenario, summary, current_state, expected_context, expected_start_state, expected_end_state):
         # Given: Jira manager with issue that has assertion failure (current != expected)
         mock_jira_instance = self._create_scenario_with_issues_from_assertion_specs(mock_get_credentials, mock_jira_class, [
             {'key': 'PROJ-TEST', 'current': current_state, 'expected': expected_end_state, 'issue_type': 'Bug', 'context': expected_context, 'summary': summary}
         ])
         
-        # When: Assert CLI command is executed with print capture
-        mock_print = self._execute_JiraUtil_with_args(mock_get_credentials, mock_jira_class,
-                                                   'tf', 'a', '--tsl', 'rule-testing')
+        # When: Assert CLI command is executed with output capture
+        printed_output = self._execute_JiraUtil_and_capture_output(capsys, mock_get_credentials, mock_jira_class,
+                                                                   'tf', 'a', '--tsl', 'rule-testing')
         
         # Then: Jira API should be called correctly
         mock_jira_instance.get_issues_by_label.assert_called_once_with("rule-testing")
         
         # And: The issue should appear in the output (since current != expected)
-        printed_output = '\n'.join([call[0][0] for call in mock_print.call_args_list if call[0]])
         assert 'PROJ-TEST' in printed_output, f"Issue key should appear in output for scenario: {scenario}"
         
         # Verify context extraction from summary appears in output
@@ -87,124 +142,52 @@ class TestTestFixtureAssert(TestJiraUtilsCommand):
         assert current_state in printed_output, f"Current state should appear in output for scenario: {scenario}"
         assert expected_end_state in printed_output, f"Expected state should appear in output for scenario: {scenario}"
 
-    # =============================================================================
-    # PRIVATE HELPER METHODS (sorted alphabetically)
-    # =============================================================================
 
-    def _create_failed_issue_from_spec(self, spec, i):
-        context_prefix = self._extract_context_prefix_from_spec(spec)
-        current_state = spec.get('current', 'New')
-        expected_state = spec.get('expected', 'Done')
-        if current_state == expected_state:  # Ensure they're different to trigger assertion failure
-            expected_state = 'Ready' if current_state == 'New' else 'Done'
-        summary = self._generate_summary(context_prefix, current_state, expected_state, i)
-        return self._create_issue_data(spec, summary, current_state)
-
-    def _create_issue_data(self, spec, summary, current_state):
-        return {
-            'key': spec['key'],
-            'summary': summary,
-            'status': current_state,
-            'issue_type': spec.get('issue_type', 'Story'),
-            'parent_key': spec.get('parent_key'),
-            'rank': spec.get('rank', '0|i0000:')
-        }
-
-    def _create_passed_issue_from_spec(self, spec, i):
-        context_prefix = self._extract_context_prefix_from_spec(spec)
-        current_state = spec.get('current', 'New')
-        expected_state = current_state
-        summary = self._generate_summary(context_prefix, current_state, expected_state, i)
-        return self._create_issue_data(spec, summary, current_state)
-
-    def _create_scenario_with_issues_from_assertion_specs(self, mock_get_credentials, mock_jira_class, issue_specs):
-        # Setup mock credentials
-        self._setup_mock_credentials(mock_get_credentials)
-        
-        issue_data_list = []
-        
-        for i, spec in enumerate(issue_specs):
-            # Handle assert_result logic
-            assert_result = spec.get('assert_result')
-            if assert_result == 'Skip':
-                issue_data_list.append(self._create_skipped_issue_from_spec(spec))
-            elif assert_result == 'Pass':
-                issue_data_list.append(self._create_passed_issue_from_spec(spec, i))
-            else:  # assume 'Failed' or None
-                issue_data_list.append(self._create_failed_issue_from_spec(spec, i))
-        
-        mock_jira_instance = Mock()
-        mock_jira_instance.get_issues_by_label.return_value = issue_data_list
-        mock_jira_instance.connect.return_value = True
-        mock_jira_class.return_value = mock_jira_instance
-        return mock_jira_instance
-
-    def _create_skipped_issue_from_spec(self, spec):
-        summary = "Skipped issue"
-        current_state = spec.get('current', 'New')
-        return self._create_issue_data(spec, summary, current_state)
-
-    def _extract_context_prefix_from_spec(self, spec):
-        context = spec.get('context')
-        if context is None and spec.get('issue_type') is not None:
-            context = f"{spec.get('issue_type')}"
-        return f"{context} - " if context else ""
-
-    def _generate_summary(self, context_prefix, current_state, expected_state, index):
-        """Randomize the summary to use all possible valid evaluatable summary structures."""
-        if index % 2 == 1:
-            return f"{context_prefix}I was in {current_state} - expected to be in {expected_state}"
-        else:
-            return f"{context_prefix}starting in {current_state} - expected to be in {expected_state}"
-
-
-class TestHierarchicalFailureOrganization(TestTestFixtureAssert):
+class TestHierarchicalFailureOrganization(AssertCommandScenarios):
     # =============================================================================
     # PUBLIC TEST METHODS (sorted alphabetically)
     # =============================================================================
 
     @patch('testfixture_cli.handlers.JiraInstanceManager')
     @patch('testfixture_cli.handlers.get_jira_credentials')
-    def test_assert_failures_displays_orphans(self, mock_get_credentials, mock_jira_class):
+    def test_assert_failures_displays_orphans(self, mock_get_credentials, mock_jira_class, capsys):
         """Test that orphaned item with real Jira format appears in issues_to_report."""
         # Given: An orphaned Sub-task with real Jira summary format (like TAPS-211)
-        mock_jira_instance = self._create_scenario_with_issues_from_assertion_specs(mock_get_credentials, mock_jira_class, [
+        self._create_scenario_with_issues_from_assertion_specs(mock_get_credentials, mock_jira_class, [
             {'key': 'TAPS-211', 'issue_type': 'Sub-task'}
         ])
         
         # When: Assert CLI command is executed
-        mock_print = self._execute_JiraUtil_with_args(mock_get_credentials, mock_jira_class,
-                                                   'tf', 'a', '--tsl', 'test-label')
+        printed_output = self._execute_JiraUtil_and_capture_output(capsys, mock_get_credentials, mock_jira_class,
+                                                                   'tf', 'a', '--tsl', 'test-label')
         
         # Then: The orphaned item with real Jira format should appear in failures
-        self._assert_issues_in_summary_section(mock_print, [
+        clean_lines = self._strip_ansi_codes(printed_output)
+        self._assert_issues_in_summary_section(clean_lines, [
             {'line_with_key': 'TAPS-211', 'contains': ['[FAIL]', '[Sub-task]']}
         ])
         
         # Verify counts
-        clean_output = self._strip_ansi_codes(mock_print)
-        clean_output_str = '\n'.join(clean_output)
-        assert 'Assertions failed: 1' in clean_output_str, "Should have 1 failed assertion"
-        assert 'Not evaluated: 0' in clean_output_str, "Should have 0 not evaluated"
+        assert '  Assertions failed: 1' in clean_lines, "Should have 1 failed assertion"
+        assert '  Not evaluated: 0' in clean_lines, "Should have 0 not evaluated"
 
     @patch('testfixture_cli.handlers.JiraInstanceManager')
     @patch('testfixture_cli.handlers.get_jira_credentials')
-    def test_assert_failures_displays_three_level_hierarchy_with_indentation(self, mock_get_credentials, mock_jira_class):
+    def test_assert_failures_displays_three_level_hierarchy_with_indentation(self, mock_get_credentials, mock_jira_class, capsys):
         """Test 3-level hierarchy: Epic (non-evaluated) -> Story (non-evaluated) -> Subtask (failing)."""
         # Given: Epic with non-evaluated story and failing subtask (3-level hierarchy)
-        mock_jira_instance = self._create_scenario_with_issues_from_assertion_specs(mock_get_credentials, mock_jira_class, [
+        self._create_scenario_with_issues_from_assertion_specs(mock_get_credentials, mock_jira_class, [
             {'key': 'PROJ-1', 'issue_type': 'Epic',     'parent_key': None,       'assert_result': 'Skip'},
             {'key': 'PROJ-2', 'issue_type': 'Story',    'parent_key': 'PROJ-1',   'assert_result': 'Skip'},
             {'key': 'PROJ-3', 'issue_type': 'Sub-task', 'parent_key': 'PROJ-2'}
         ])
         
         # When: Assert CLI command is executed
-        mock_print = self._execute_JiraUtil_with_args(mock_get_credentials, mock_jira_class,
-                                                   'tf', 'a', '--tsl', 'test-label')
+        printed_output = self._execute_JiraUtil_and_capture_output(capsys, mock_get_credentials, mock_jira_class,
+                                                                   'tf', 'a', '--tsl', 'test-label')
         
         # Then the hierarchical indentation structure should be seen in the main output
-        clean_output = self._strip_ansi_codes(mock_print)
-        clean_output_str = '\n'.join(clean_output)
+        clean_output_str = ANSI_ESCAPE_PATTERN.sub('', printed_output)
         assert '- [INFO] [Epic] PROJ-1:' in clean_output_str, "Epic should appear with proper indentation"
         assert '  - [INFO] [Story] PROJ-2:' in clean_output_str, "Story should appear indented under Epic"
         assert '    - [FAIL] [Sub-task] PROJ-3:' in clean_output_str, "Sub-task should appear indented under Story"
@@ -213,117 +196,116 @@ class TestHierarchicalFailureOrganization(TestTestFixtureAssert):
         ("Orphans with children", [
             {'key': 'TAPS-210', 'issue_type': 'Story',    'parent_key': None,      'assert_result': 'Skip'},
             {'key': 'TAPS-211', 'issue_type': 'Sub-task', 'parent_key': 'TAPS-210'}
-        ], [
+        ], (
             {'line_with_key': 'TAPS-210', 'contains': ['[INFO]', '[Story]'], 'skipped_parent': True},
             {'line_with_key': 'TAPS-211', 'contains': ['[FAIL]', '[Sub-task]']}
-        ]),
+        )),
         ("issue_type_category_sorting", [
-            {'key': 'EPIC-1',   'issue_type': 'Epic',     'rank': RANKS.HIGH.value},
-            {'key': 'STORY-11', 'issue_type': 'Story',    'rank': RANKS.LOW.value},
-            {'key': 'SUBT-111', 'issue_type': 'Sub-task', 'rank': RANKS.MID.value}
-        ], [
+            {'key': 'EPIC-1',   'issue_type': 'Epic',     'rank': HIGH_RANK},
+            {'key': 'STORY-11', 'issue_type': 'Story',    'rank': LOW_RANK},
+            {'key': 'SUBT-111', 'issue_type': 'Sub-task', 'rank': MID_RANK}
+        ], (
             {'line_with_key': 'EPIC-1'},
             {'line_with_key': 'SUBT-111'},
             {'line_with_key': 'STORY-11'}
-        ]),
+        )),
         ("epics_rank_sorting", [
-            {'key': 'PROJ-1', 'issue_type': 'Epic', 'rank': RANKS.LOW.value},
-            {'key': 'PROJ-2', 'issue_type': 'Epic', 'rank': RANKS.HIGH.value},
-            {'key': 'PROJ-3', 'issue_type': 'Epic', 'rank': RANKS.MID.value}
-        ], [
+            {'key': 'PROJ-1', 'issue_type': 'Epic', 'rank': LOW_RANK},
+            {'key': 'PROJ-2', 'issue_type': 'Epic', 'rank': HIGH_RANK},
+            {'key': 'PROJ-3', 'issue_type': 'Epic', 'rank': MID_RANK}
+        ], (
             {'line_with_key': 'PROJ-2'},
             {'line_with_key': 'PROJ-3'},
             {'line_with_key': 'PROJ-1'}
-        ]),
+        )),
         ("orphaned_evaluable_items", [
-            {'key': 'PROJ-1', 'issue_type': 'Sub-task', 'parent_key': None, 'rank': RANKS.HIGH.value}
-        ], [
-            {'line_with_key': 'PROJ-1', 'contains': ['[FAIL]', '[Sub-task]']}
-        ]),
+            {'key': 'PROJ-1', 'issue_type': 'Sub-task', 'parent_key': None, 'rank': HIGH_RANK}
+        ], (
+            {'line_with_key': 'PROJ-1', 'contains': ['[FAIL]', '[Sub-task]']},
+        )),
         ("color_tags_epic", [
             {'key': 'TAPS-215', 'issue_type': 'Epic'}
-        ], [
-            {'line_with_key': 'TAPS-215', 'contains': ['[FAIL]', '[Epic]']}
-        ]),
+        ], (
+            {'line_with_key': 'TAPS-215', 'contains': ['[FAIL]', '[Epic]']},
+        )),
         ("color_tags_story", [
             {'key': 'TAPS-210', 'issue_type': 'Story'}
-        ], [
-            {'line_with_key': 'TAPS-210', 'contains': ['[FAIL]', '[Story]']}
-        ]),
+        ], (
+            {'line_with_key': 'TAPS-210', 'contains': ['[FAIL]', '[Story]']},
+        )),
         ("color_tags_subtask", [
             {'key': 'TAPS-211', 'issue_type': 'Sub-task'}
-        ], [
-            {'line_with_key': 'TAPS-211', 'contains': ['[FAIL]', '[Sub-task]']}
-        ]),
+        ], (
+            {'line_with_key': 'TAPS-211', 'contains': ['[FAIL]', '[Sub-task]']},
+        )),
         ("mixed_pass_fail_assertions", [
             {'key': 'PROJ-1', 'current': 'In Progress', 'expected': 'Done'},
             {'key': 'PROJ-2', 'current': 'Done', 'expected': 'Done'}
-        ], [
-            {'line_with_key': 'PROJ-1', 'contains': ['[FAIL]']}
-        ]),
+        ], (
+            {'line_with_key': 'PROJ-1', 'contains': ['[FAIL]']},
+        )),
         ("stories_within_epic_sorted_by_rank", [
-            {'key': 'EPIC-1',  'issue_type': 'Epic', 'rank': RANKS.HIGH.value,  'parent_key': None},
-            {'key': 'STORY-3', 'issue_type': 'Story', 'rank': RANKS.LOW.value,  'parent_key': 'EPIC-1'},
-            {'key': 'STORY-1', 'issue_type': 'Story', 'rank': RANKS.HIGH.value, 'parent_key': 'EPIC-1'},
-            {'key': 'STORY-2', 'issue_type': 'Story', 'rank': RANKS.MID.value,  'parent_key': 'EPIC-1'}
-        ], [
+            {'key': 'EPIC-1',  'issue_type': 'Epic', 'rank': HIGH_RANK,  'parent_key': None},
+            {'key': 'STORY-3', 'issue_type': 'Story', 'rank': LOW_RANK,   'parent_key': 'EPIC-1'},
+            {'key': 'STORY-1', 'issue_type': 'Story', 'rank': HIGH_RANK,  'parent_key': 'EPIC-1'},
+            {'key': 'STORY-2', 'issue_type': 'Story', 'rank': MID_RANK,   'parent_key': 'EPIC-1'}
+        ], (
             {'line_with_key': 'EPIC-1'},
             {'line_with_key': 'STORY-1'},
             {'line_with_key': 'STORY-2'},
             {'line_with_key': 'STORY-3'}
-        ]),
+        )),
         ("mixed_epics_and_orphaned_items", [
-            {'key': 'PROJ-1', 'issue_type': 'Epic',     'rank': RANKS.HIGH.value, 'parent_key': None},
-            {'key': 'PROJ-2', 'issue_type': 'Story',    'rank': RANKS.MID.value,  'parent_key': 'PROJ-1'},
-            {'key': 'PROJ-3', 'issue_type': 'Sub-task', 'rank': RANKS.LOW.value,  'parent_key': None}
-        ], [
+            {'key': 'PROJ-1', 'issue_type': 'Epic',     'rank': HIGH_RANK,  'parent_key': None},
+            {'key': 'PROJ-2', 'issue_type': 'Story',    'rank': MID_RANK,   'parent_key': 'PROJ-1'},
+            {'key': 'PROJ-3', 'issue_type': 'Sub-task', 'rank': LOW_RANK,   'parent_key': None}
+        ], (
             {'line_with_key': 'PROJ-1'},
             {'line_with_key': 'PROJ-2'},
             {'line_with_key': 'PROJ-3'}
-        ]),
+        )),
         ("multiple_epics_with_children", [
-            {'key': 'PROJ-1', 'issue_type': 'Epic',  'rank': RANKS.LOW.value,   'parent_key': None},
-            {'key': 'PROJ-2', 'issue_type': 'Story', 'rank': RANKS.MID.value,   'parent_key': 'PROJ-1'},
-            {'key': 'PROJ-3', 'issue_type': 'Epic',  'rank': RANKS.HIGH.value,  'parent_key': None},
-            {'key': 'PROJ-4', 'issue_type': 'Story', 'rank': RANKS.LOWER.value, 'parent_key': 'PROJ-3'}
-        ], [
+            {'key': 'PROJ-1', 'issue_type': 'Epic',  'rank': LOW_RANK,   'parent_key': None},
+            {'key': 'PROJ-2', 'issue_type': 'Story', 'rank': MID_RANK,   'parent_key': 'PROJ-1'},
+            {'key': 'PROJ-3', 'issue_type': 'Epic',  'rank': HIGH_RANK,  'parent_key': None},
+            {'key': 'PROJ-4', 'issue_type': 'Story', 'rank': LOWER_RANK, 'parent_key': 'PROJ-3'}
+        ], (
             {'line_with_key': 'PROJ-3'},
             {'line_with_key': 'PROJ-4'},
             {'line_with_key': 'PROJ-1'},
             {'line_with_key': 'PROJ-2'}
-        ]),
+        )),
         ("children_found_before_parents", [
-            {'key': 'PROJ-2', 'issue_type': 'Story', 'rank': RANKS.MID.value,  'parent_key': 'PROJ-1'},
-            {'key': 'PROJ-1', 'issue_type': 'Epic',  'rank': RANKS.HIGH.value, 'parent_key': None}
-        ], [
+            {'key': 'PROJ-2', 'issue_type': 'Story', 'rank': MID_RANK,   'parent_key': 'PROJ-1'},
+            {'key': 'PROJ-1', 'issue_type': 'Epic',  'rank': HIGH_RANK,  'parent_key': None}
+        ], (
             {'line_with_key': 'PROJ-1'},
             {'line_with_key': 'PROJ-2'}
-        ])
+        ))
     ])
     @patch('testfixture_cli.handlers.JiraInstanceManager')
     @patch('testfixture_cli.handlers.get_jira_credentials')
-    def test_assert_failures_sorting_behavior(self, mock_get_credentials, mock_jira_class, test_name, issue_specs, expected_specs):
-        mock_jira_instance = self._create_scenario_with_issues_from_assertion_specs(mock_get_credentials, mock_jira_class, issue_specs)
-        mock_print = self._execute_JiraUtil_with_args(mock_get_credentials, mock_jira_class,
-                                                   'tf', 'a', '--tsl', 'test-label')
-        self._assert_issues_in_summary_section(mock_print, expected_specs)
+    def test_assert_failures_sorting_behavior(self, mock_get_credentials, mock_jira_class, capsys, test_name, issue_specs, expected_specs):
+        self._create_scenario_with_issues_from_assertion_specs(mock_get_credentials, mock_jira_class, issue_specs)
+        printed_output = self._execute_JiraUtil_and_capture_output(capsys, mock_get_credentials, mock_jira_class,
+                                                                   'tf', 'a', '--tsl', 'test-label')
+        self._assert_issues_in_summary_section(self._strip_ansi_codes(printed_output), expected_specs)
 
     @patch('testfixture_cli.handlers.JiraInstanceManager')
     @patch('testfixture_cli.handlers.get_jira_credentials')
-    def test_assert_failures_skips_orphaned_non_evaluable_items(self, mock_get_credentials, mock_jira_class):
+    def test_assert_failures_skips_orphaned_non_evaluable_items(self, mock_get_credentials, mock_jira_class, capsys):
         """Test that orphaned non-evaluable items are currently skipped and not included in issues_to_report."""
         # Given: An orphaned Sub-task without assertion pattern (non-evaluable)
-        mock_jira_instance = self._create_scenario_with_issues_from_assertion_specs(mock_get_credentials, mock_jira_class, [
+        self._create_scenario_with_issues_from_assertion_specs(mock_get_credentials, mock_jira_class, [
             {'key': 'PROJ-1', 'issue_type': 'Sub-task', 'parent_key': None, 'assert_result': 'Skip'}
         ])
         
         # When: Assert CLI command is executed
-        mock_print = self._execute_JiraUtil_with_args(mock_get_credentials, mock_jira_class,
-                                                   'tf', 'a', '--tsl', 'test-label')
+        printed_output = self._execute_JiraUtil_and_capture_output(capsys, mock_get_credentials, mock_jira_class,
+                                                                   'tf', 'a', '--tsl', 'test-label')
         
         # Then: The orphaned non-evaluable item should be skipped and not appear in failure report
-        clean_output = self._strip_ansi_codes(mock_print)
-        clean_output_str = '\n'.join(clean_output)
+        clean_output_str = ANSI_ESCAPE_PATTERN.sub('', printed_output)
         
         # Verify the item is processed but skipped
         assert 'Asserting PROJ-1:' in clean_output_str, "Item should be processed"
@@ -331,7 +313,8 @@ class TestHierarchicalFailureOrganization(TestTestFixtureAssert):
         
         # Verify it appears in "Not evaluated" section but not in failures
         assert 'Not evaluated: PROJ-1' in clean_output_str, "Item should appear in not evaluated list"
-        assert 'Failures:' not in clean_output_str or 'PROJ-1' not in clean_output_str.split('Failures:')[1], "Item should not appear in failures section"
+        failures_section = clean_output_str.partition('Failures:')[2]  # Empty when there is no failures section
+        assert 'PROJ-1' not in failures_section, "Item should not appear in failures section"
         
         # Verify counts
         assert 'Assertions failed: 0' in clean_output_str, "Should have 0 failed assertions"
@@ -342,12 +325,13 @@ class TestHierarchicalFailureOrganization(TestTestFixtureAssert):
     # PRIVATE HELPER METHODS (sorted alphabetically)
     # =============================================================================
 
-    def _assert_issues_in_summary_section(self, mock_print, issue_specs, in_order=True):
+    def _assert_issues_in_summary_section(self, clean_lines, issue_specs, in_order=True):
         """
         Assert that issues appear in the summary section with expected tags and order.
         
         Args:
-            mock_print: Mock print object from CLI execution
+            clean_lines: Captured stdout lines with ANSI codes removed (see _strip_ansi_codes),
+                split once by the caller and reused for all checks
             
             issue_specs: List of dicts 
                 'line_with_key' 
@@ -364,7 +348,7 @@ class TestHierarchicalFailureOrganization(TestTestFixtureAssert):
 
             in_order: default: True
         """
-        summary_lines = self._extract_summary_section(mock_print)
+        summary_lines = self._extract_summary_section(clean_lines)
         
         # Collect all needed data from summary lines
         collection_result = self._collect_issue_data_from_summary(summary_lines, issue_specs, in_order)
@@ -379,29 +363,15 @@ class TestHierarchicalFailureOrganization(TestTestFixtureAssert):
         Returns:
             dict: Collection result with 'issue_data', 'issue_counts', 'issue_keys', 'expected_keys'
         """
-        issue_data = {}  # For contains verification
-        issue_keys = []  # For order verification
-        seen_keys = set()  # For order verification
-        issue_counts = {}  # For count verification
         expected_keys = [spec['line_with_key'] for spec in issue_specs]  # For order verification
+        line_indexes = self._index_issue_keys(summary_lines, expected_keys)
         
-        # Single pass through summary lines to collect all needed data
-        for line in summary_lines:
-            for spec in issue_specs:
-                key = spec['line_with_key']
-                
-                if key in line:
-                    # Collect line data (first occurrence only)
-                    if key not in issue_data:
-                        issue_data[key] = line
-                    
-                    # Track count for count verification (all occurrences)
-                    issue_counts[key] = issue_counts.get(key, 0) + 1
-                    
-                    # Collect order information if requested (first occurrence only)
-                    if in_order and key not in seen_keys:
-                        issue_keys.append(key)
-                        seen_keys.add(key)
+        # Line data for contains verification (first occurrence only)
+        issue_data = {key: summary_lines[indexes[0]] for key, indexes in line_indexes.items()}
+        # Count for count verification (all occurrences)
+        issue_counts = {key: len(indexes) for key, indexes in line_indexes.items()}
+        # Order information if requested; keys are indexed in order of first occurrence
+        issue_keys = list(line_indexes) if in_order else []
         
         return {
             'issue_data': issue_data,
@@ -410,9 +380,7 @@ class TestHierarchicalFailureOrganization(TestTestFixtureAssert):
             'expected_keys': expected_keys
         }
 
-    def _extract_summary_section(self, mock_print):
-        clean_lines = self._strip_ansi_codes(mock_print)
-
+    def _extract_summary_section(self, clean_lines):
         # Find the summary section (after "Assertion process completed:")
         summary_start = self._find_summary_section_start(clean_lines)
 
@@ -426,15 +394,22 @@ class TestHierarchicalFailureOrganization(TestTestFixtureAssert):
                 return i
         return None
 
-    def _strip_ansi_codes(self, mock_print):
-        # Join all printed lines 
-        # to remove ANSI escape sequences in one go
-        # which makes assertions easier
+    def _index_issue_keys(self, lines, issue_keys):
+        # Map each wanted issue key to the indexes of the lines containing it,
+        # using one scan of the precompiled key pattern per line
+        wanted_keys = set(issue_keys)
+        line_indexes = {}
+        for i, line in enumerate(lines):
+            for key in dict.fromkeys(ISSUE_KEY_PATTERN.findall(line)):
+                if key in wanted_keys:
+                    line_indexes.setdefault(key, []).append(i)
+        return line_indexes
 
-        printed_output = '\n'.join([call[0][0] for call in mock_print.call_args_list if call[0]])
+    def _strip_ansi_codes(self, printed_output):
+        # Remove ANSI escape sequences from the captured output in one go
+        # which makes assertions easier
 
-        import re
-        lines = re.sub(r'\x1b\[[0-9;]*m', '', printed_output)
+        lines = ANSI_ESCAPE_PATTERN.sub('', printed_output)
 
         return lines.split('\n')
 
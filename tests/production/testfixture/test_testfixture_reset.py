@@ -2,17 +2,10 @@
 Tests for test fixture reset operations.
 """
 
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
-# Add tests directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-
 import pytest
 from unittest.mock import Mock, patch
 
+from tests.fixtures import create_mock_manager
 from tests.production.base_test_jira_utils_command import TestJiraUtilsCommand
 
 
@@ -124,10 +117,7 @@ class TestTestFixtureReset(TestJiraUtilsCommand):
             }
             issue_data_list.append(issue_data)
         
-        mock_jira_instance = Mock()
-        mock_jira_instance.get_issues_by_label.return_value = issue_data_list
-        mock_jira_instance.update_issue_status.return_value = True
-        mock_jira_instance.connect.return_value = True
+        mock_jira_instance = create_mock_manager(issues=issue_data_list)
         mock_jira_class.return_value = mock_jira_instance
         return mock_jira_instance
 
@@ -2,13 +2,8 @@
 Tests for test fixture trigger operations.
 """
 
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
-
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from testfixture.trigger_processor import _parse_labels_string
 
@@ -25,18 +20,18 @@ class TestTestFixtureTrigger(TestJiraUtilsCommand):
     ])
     @patch('testfixture_cli.handlers.JiraInstanceManager')
     @patch('testfixture_cli.handlers.get_jira_credentials')
-    def test_trigger_error_scenarios(self, mock_get_credentials, mock_jira_class, scenario, trigger_labels, expected_error_contains, mock_manager_factory):
+    def test_trigger_error_scenarios(self, mock_get_credentials, mock_jira_class, capsys, scenario, trigger_labels, expected_error_contains, mock_manager_factory):
         # Given: Jira manager based on scenario
         self._setup_mock_credentials(mock_get_credentials)
         mock_jira_instance = self._create_mock_jira_instance_for_scenario(mock_manager_factory)
         mock_jira_class.return_value = mock_jira_instance
         
         # When: CLI trigger command is executed
-        mock_print = self._execute_JiraUtil_with_args(mock_get_credentials, mock_jira_class,
-                                                   'tf', 't', '--tl', trigger_labels, '-k', 'PROJ-1')
+        printed_output = self._execute_JiraUtil_and_capture_output(capsys, mock_get_credentials, mock_jira_class,
+                                                                    'tf', 't', '--tl', trigger_labels, '-k', 'PROJ-1')
         
         # Then: Should show appropriate error message
-        error_found = self._extract_error_message(mock_print, expected_error_contains)
+        error_found = self._extract_error_message(printed_output, expected_error_contains)
         assert error_found, f"Expected error message containing {expected_error_contains} for scenario: {scenario}"
 
     @pytest.mark.parametrize("scenario,existing_labels,trigger_labels,expected_final_labels,expected_update_calls", [
@@ -120,7 +115,7 @@ class TestTestFixtureTrigger(TestJiraUtilsCommand):
     @patch('time.sleep')  # Mock sleep to avoid 5-second delay when trigger labels overlap with existing labels
     @patch('testfixture_cli.handlers.JiraInstanceManager')
     @patch('testfixture_cli.handlers.get_jira_credentials')
-    def test_trigger_scenarios_remove_and_add(self, mock_sleep, mock_get_credentials, mock_jira_class, scenario, existing_labels, trigger_labels, expected_after_removal, expected_final_labels):
+    def test_trigger_scenarios_remove_and_add(self, mock_sleep, mock_get_credentials, mock_jira_class, capsys, scenario, existing_labels, trigger_labels, expected_after_removal, expected_final_labels):
         """Test trigger scenarios where labels need removing first, then adding."""
         # Given: Jira instance with issue having specific existing labels
         self._setup_mock_credentials(mock_get_credentials)
@@ -134,8 +129,8 @@ class TestTestFixtureTrigger(TestJiraUtilsCommand):
         mock_jira_class.return_value = mock_jira_instance
         
         # When: CLI trigger command is executed
-        mock_print = self._execute_JiraUtil_with_args(mock_get_credentials, mock_jira_class,
-                                                    'tf', 't', '--tl', trigger_labels, '-k', 'TAPS-211')
+        printed_output = self._execute_JiraUtil_and_capture_output(capsys, mock_get_credentials, mock_jira_class,
+                                                                    'tf', 't', '--tl', trigger_labels, '-k', 'TAPS-211')
         
         # Then: Should call update twice when labels need removing (remove + add), once when just adding
         expected_calls = 2 if any(label in existing_labels for label in _parse_labels_string(trigger_labels)) else 1
@@ -147,17 +142,15 @@ class TestTestFixtureTrigger(TestJiraUtilsCommand):
         assert set(actual_final_labels) == set(expected_final_labels), f"Expected {expected_final_labels}, got {actual_final_labels} for scenario: {scenario}"
         
         # Verify logging: should log both remove and add messages
-        remove_message, add_message = self._extract_messages(mock_print)
+        remove_message, add_message = self._extract_messages(printed_output)
         assert remove_message, f"Expected INFO message about label removal for scenario: {scenario}"
         assert add_message, f"Expected INFO message about label addition for scenario: {scenario}"
 
 
     # Private helper methods 
     def _create_mock_issue_with_labels(self, labels):
-        mock_issue = Mock()
-        mock_issue.key = "TAPS-212"
-        mock_issue.fields.labels = labels
-        return mock_issue
+        # Plain data holder; only update() needs call tracking
+        return SimpleNamespace(key="TAPS-212", fields=SimpleNamespace(labels=labels), update=Mock())
 
     def _create_mock_jira_manager(self, mock_issue):
         mock_jira_manager = Mock()
@@ -184,11 +177,8 @@ class TestTestFixtureTrigger(TestJiraUtilsCommand):
     def _create_mock_jira_instance_with_issue(self, issue_data):
         """Create a mock Jira instance with a specific issue for CLI testing."""
         mock_jira_instance = Mock()
-        mock_issue = Mock()
-        mock_issue.key = issue_data['key']
-        mock_issue.fields.summary = issue_data['summary']
-        mock_issue.fields.labels = issue_data.get('labels', [])
-        mock_issue.update = Mock()
+        fields = SimpleNamespace(summary=issue_data['summary'], labels=issue_data.get('labels', []))
+        mock_issue = SimpleNamespace(key=issue_data['key'], fields=fields, update=Mock())
         mock_jira_instance.jira.issue.return_value = mock_issue
         return mock_jira_instance
 
@@ -199,16 +189,13 @@ class TestTestFixtureTrigger(TestJiraUtilsCommand):
         return mock_jira_manager
 
 
-    def _extract_error_message(self, mock_print, expected_error_contains):
-        calls = mock_print.call_args_list
-        error_messages = [call[0][0] for call in calls if len(call[0]) > 0]
-        return any(all(keyword in msg.lower() for keyword in expected_error_contains) for msg in error_messages)
+    def _extract_error_message(self, printed_output, expected_error_contains):
+        lines = printed_output.lower().splitlines()
+        return any(all(keyword in line for keyword in expected_error_contains) for line in lines)
 
-    def _extract_messages(self, mock_print):
-        calls = mock_print.call_args_list
-        messages = [call[0][0] for call in calls if len(call[0]) > 0]
-        remove_message = any("Labels Removed:" in msg for msg in messages)
-        add_message = any("Labels Set:" in msg for msg in messages)
+    def _extract_messages(self, printed_output):
+        remove_message = "Labels Removed:" in printed_output
+        add_message = "Labels Set:" in printed_output
         return remove_message, add_message
 
 
@@ -3,12 +3,9 @@ Tests for chained test fixture commands functionality.
 """
 
 import unittest
+from contextlib import redirect_stdout
+from io import StringIO
 from unittest.mock import patch, MagicMock
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
 
 from cli.parser import build_parser
 from testfixture_cli.handlers import handle_test_fixture_commands
@@ -17,9 +14,10 @@ from testfixture_cli.handlers import handle_test_fixture_commands
 class TestTFChainedCommands(unittest.TestCase):
     """Test chained test fixture commands functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parser = build_parser()
+    @classmethod
+    def setUpClass(cls):
+        """Build the parser once; parse_args does not mutate it."""
+        cls.parser = build_parser()
 
     def test_parse_chained_commands_reset_trigger(self):
         """Test parsing chained commands: reset then trigger."""
@@ -194,9 +192,9 @@ class TestTFChainedCommands(unittest.TestCase):
         args.username = None
         args.password = None
         
-        with patch('builtins.print') as mock_print:
+        with redirect_stdout(StringIO()) as output:
             handle_test_fixture_commands(args, {})
-            mock_print.assert_called_with("[FATAL] ERROR: Trigger command requires --tl/--trigger-label argument")
+        self.assertEqual(output.getvalue().splitlines()[-1], "[FATAL] ERROR: Trigger command requires --tl/--trigger-label argument")
 
     def test_parse_chained_commands_same_command_multiple_times(self):
         """Test parsing chained commands with same command repeated multiple times."""
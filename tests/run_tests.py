@@ -21,6 +21,9 @@ RETURNCODE_IMPORT_ERROR = 2
 RETURNCODE_FILE_NOT_FOUND = 3
 RETURNCODE_UNKNOWN_CATEGORY = 4
 
+# Base pytest command for every runner entry point; selects slow tests too, which pytest.ini's addopts deselects by default
+PYTEST_BASE_CMD = [sys.executable, "-m", "pytest", "-m", "slow or not slow"]
+
 # Fix Unicode encoding issues on Windows (without detaching buffers for pytest compatibility)
 if sys.platform == "win32":
     import io
@@ -90,9 +93,7 @@ def run_tests():
 	print("-" * 60)
 	
 	# Run pytest with comprehensive output
-	cmd = [
-		sys.executable, "-m", "pytest"
-	] + test_files + [
+	cmd = PYTEST_BASE_CMD + test_files + [
 		"-v",                    # Verbose output
 		"--tb=short",           # Short traceback format
 		"--strict-markers",     # Strict marker handling
@@ -136,12 +137,12 @@ def run_tests():
 def run_specific_test_category(category):
 	"""Run tests for a specific category, file, or pattern."""
 	category_mapping = {
-		"csv": "test_csv_export_commands.py",
+		"csv": "tests/production/csvexport/test_csv_export_commands.py",
 		"testfixture": ["tests/production/testfixture/test_testfixture_trigger.py", "tests/production/testfixture/test_testfixture_assert.py", "tests/production/testfixture/test_testfixture_reset.py"],
-		"cli": "test_cli_commands.py",
-		"overview": "test_functional_overview.py",
-		"color": "test_color_system.py",
-		"version": "test_version_manager.py",
+		"cli": "tests/production/core/test_cli_commands.py",
+		"overview": "tests/production/core/test_functional_overview.py",
+		"color": "tests/production/core/test_color_system.py",
+		"version": "tests/delivery/test_version_manager.py",
 		"all": None
 	}
 	
@@ -152,6 +153,11 @@ def run_specific_test_category(category):
 	if category.endswith('.py'):
 		# Direct file path provided
 		test_file = f"tests/{category}" if not category.startswith('tests/') else category
+		if not Path(test_file).exists():
+			# Bare file name: look it up in the test subdirectories
+			matching_files = [f for f in find_test_files() if Path(f).name == Path(category).name]
+			if len(matching_files) == 1:
+				test_file = matching_files[0]
 		if not Path(test_file).exists():
 			colored_print(f"[ERROR] Test file not found: {test_file}")
 			return RETURNCODE_FILE_NOT_FOUND
@@ -161,7 +167,7 @@ def run_specific_test_category(category):
 	if category.startswith('test_'):
 		colored_print(f"[TEST] Running tests matching pattern: {category}")
 		src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
-		cmd = [sys.executable, "-m", "pytest", "-k", category, "-v", "--tb=short"]
+		cmd = PYTEST_BASE_CMD + ["-k", category, "-v", "--tb=short"]
 		env = os.environ.copy()
 		env['PYTHONPATH'] = src_path
 		return run_pytest_command_with_env(cmd, f"tests matching '{category}'", env)
@@ -207,7 +213,7 @@ def run_test_file(test_file, description):
 	colored_print(f"[TEST] Running {description} tests...")
 	# Add src to Python path for pytest
 	src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
-	cmd = [sys.executable, "-m", "pytest", test_file, "-v", "--tb=short"]
+	cmd = PYTEST_BASE_CMD + [test_file, "-v", "--tb=short"]
 	env = os.environ.copy()
 	env['PYTHONPATH'] = src_path
 	return run_pytest_command_with_env(cmd, description, env)